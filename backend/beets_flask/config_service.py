@@ -1,4 +1,8 @@
+import copy
+import os
 import shutil
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -6,44 +10,73 @@ import yaml
 
 from beets_flask.config import get_config
 
-SUPPORTED_METADATA_PLUGINS = [
-    "discogs",
-    "spotify",
-    "musicbrainz",
-]
+
+@lru_cache(maxsize=1)
+def _default_beets_config_path() -> Path:
+    """Resolve the beets config path once.
+
+    It only depends on environment variables, so there is no need to
+    re-resolve it for every request.
+    """
+    return Path(get_config().get_beets_config_path())
+
+# Prefer the libyaml-backed loader/dumper when available, they are
+# considerably faster than the pure-python implementations.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Interned, so comparisons against strings coming out of the YAML parser
+# can short-circuit on pointer equality.
+SUPPORTED_METADATA_PLUGINS = frozenset(
+    sys.intern(name)
+    for name in (
+        "discogs",
+        "spotify",
+        "musicbrainz",
+    )
+)
+
+# Substrings that mark a settings key as sensitive and thus to be redacted.
+SENSITIVE_KEYWORDS = tuple(sys.intern(kw) for kw in ("token", "secret", "key"))
+
+
+def _redacted(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow copy of a settings dict with sensitive values masked."""
+    return {
+        key: "********" if any(kw in key for kw in SENSITIVE_KEYWORDS) else value
+        for key, value in settings.items()
+    }
 
 
 class ConfigService:
     def __init__(self, config=None):
-        self.config = config or get_config()
-        self.beets_config_path: Path = Path(self.config.get_beets_config_path())
+        if config is None:
+            self.config = get_config()
+            self.beets_config_path: Path = _default_beets_config_path()
+        else:
+            self.config = config
+            self.beets_config_path = Path(config.get_beets_config_path())
+        # Parsed config cached together with the file stat it was read from.
+        self._cache: tuple[tuple[int, int], Dict[str, Any]] | None = None
 
     def get_metadata_plugins_config(self) -> Dict[str, Any]:
         """
         Reads the beets config and returns a dictionary of supported metadata plugins
         and their configurations. Redacts sensitive fields.
         """
-        config_data = self._read_config_yaml()
-        enabled_plugins = config_data.get("plugins", [])
-        
-        plugins_config = {}
-        for plugin in SUPPORTED_METADATA_PLUGINS:
-            is_enabled = plugin in enabled_plugins
-            plugin_settings = config_data.get(plugin, {})
-
-            # Redact sensitive fields
-            redacted_settings = {}
-            for key, value in plugin_settings.items():
-                if "token" in key or "secret" in key or "key" in key:
-                    redacted_settings[key] = "********"
-                else:
-                    redacted_settings[key] = value
-            
-            plugins_config[plugin] = {
-                "enabled": is_enabled,
-                "settings": redacted_settings,
+        # Only the plugins list and the supported plugin sections are needed,
+        # no point in copying the full config for this query.
+        config_data = self._read_config_sections("plugins", *SUPPORTED_METADATA_PLUGINS)
+        # Set membership instead of scanning the plugins list per plugin.
+        enabled_plugins = set(config_data.get("plugins", ()))
+
+        return {
+            plugin: {
+                "enabled": plugin in enabled_plugins,
+                "settings": _redacted(config_data.get(plugin, {})),
             }
-        return plugins_config
+            for plugin in SUPPORTED_METADATA_PLUGINS
+        }
 
     def update_metadata_plugin_config(self, plugin_name: str, settings: Dict[str, Any], enabled: bool):
         """
@@ -52,39 +85,134 @@ class ConfigService:
         if plugin_name not in SUPPORTED_METADATA_PLUGINS:
             raise ValueError(f"Plugin {plugin_name} is not supported for configuration.")
 
-        config_data = self._read_config_yaml()
+        self.update_metadata_plugins_config(
+            {plugin_name: {"settings": settings, "enabled": enabled}}
+        )
 
-        # Update enabled status
-        enabled_plugins: List[str] = config_data.get("plugins", [])
-        if enabled and plugin_name not in enabled_plugins:
-            enabled_plugins.append(plugin_name)
-        elif not enabled and plugin_name in enabled_plugins:
-            enabled_plugins.remove(plugin_name)
-        config_data["plugins"] = enabled_plugins
+    def update_metadata_plugins_config(self, updates: Dict[str, Dict[str, Any]]):
+        """
+        Updates the configuration for several metadata plugins at once.
+
+        All updates share a single read-modify-write cycle (one parse, one
+        backup, one write). `updates` maps plugin name to a dict with keys
+        "settings" (Dict[str, Any]) and "enabled" (bool).
+        """
+        unsupported = set(updates) - SUPPORTED_METADATA_PLUGINS
+        if unsupported:
+            raise ValueError(
+                f"Plugins {sorted(unsupported)} are not supported for configuration."
+            )
 
-        # Update plugin-specific settings
-        if plugin_name not in config_data:
-            config_data[plugin_name] = {}
-        
-        # Only update settings that are not redacted
-        for key, value in settings.items():
-            if value != "********":
-                config_data[plugin_name][key] = value
+        doc = self._load_config_doc()
 
+        # Work on copies of only the affected sections, the rest of the
+        # document is shared with the parse cache and never copied.
+        enabled_plugins: List[str] = list(doc.get("plugins", []))
+        plugins_changed = False
+        new_sections: Dict[str, Dict[str, Any]] = {}
+        for plugin_name, update in updates.items():
+            # Update enabled status
+            enabled = update["enabled"]
+            if enabled and plugin_name not in enabled_plugins:
+                enabled_plugins.append(plugin_name)
+                plugins_changed = True
+            elif not enabled and plugin_name in enabled_plugins:
+                enabled_plugins.remove(plugin_name)
+                plugins_changed = True
+
+            # Only update settings that are not redacted
+            section = dict(doc.get(plugin_name, {}))
+            for key, value in update["settings"].items():
+                if value != "********":
+                    section[key] = value
+            if section != doc.get(plugin_name, {}):
+                new_sections[plugin_name] = section
+
+        # Nothing effectively changed (e.g. only redacted values were sent),
+        # skip the backup and write entirely.
+        if not plugins_changed and not new_sections:
+            return
+
+        config_data = dict(doc)
+        config_data.update(new_sections)
+        config_data["plugins"] = enabled_plugins
         self._write_config_yaml(config_data)
 
     def _backup_config(self):
-        """Creates a backup of the config file."""
+        """Creates a backup of the config file.
+
+        Hard-links instead of copying: the atomic rename in
+        _write_config_yaml replaces the config's inode, so the link keeps
+        the old content without copying any bytes. Falls back to a copy
+        where the filesystem does not support hard links.
+        """
         backup_path = self.beets_config_path.with_suffix(".yaml.bak")
-        shutil.copy(self.beets_config_path, backup_path)
+        try:
+            backup_path.unlink(missing_ok=True)
+            os.link(self.beets_config_path, backup_path)
+        except OSError:
+            shutil.copy(self.beets_config_path, backup_path)
+
+    def _load_config_doc(self) -> Dict[str, Any]:
+        """Returns the parsed config document, (re)parsing only if the file changed.
+
+        Parses are cached keyed on the file's mtime and size. The returned
+        dict is the cache itself - callers must not mutate it.
+        """
+        st = self.beets_config_path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cache is None or self._cache[0] != key:
+            # Read the whole file in one call and let libyaml do the decoding,
+            # instead of feeding the parser through a buffered text stream.
+            data = yaml.load(self.beets_config_path.read_bytes(), Loader=_Loader)
+            self._cache = (key, data)
+        return self._cache[1]
+
+    def _read_config_sections(self, *keys: str) -> Dict[str, Any]:
+        """Reads only the given top-level sections of the config.
+
+        Cheaper than _read_config_yaml for small queries, as only the
+        requested sections are copied out of the cached document.
+        """
+        doc = self._load_config_doc()
+        return {k: copy.deepcopy(doc[k]) for k in keys if k in doc}
 
     def _read_config_yaml(self) -> Dict[str, Any]:
-        """Reads the raw YAML config file."""
-        with open(self.beets_config_path, "r") as f:
-            return yaml.safe_load(f)
+        """Reads the raw YAML config file.
+
+        Returns a copy, so callers can mutate the result without
+        corrupting the parse cache.
+        """
+        return copy.deepcopy(self._load_config_doc())
 
     def _write_config_yaml(self, data: Dict[str, Any]):
-        """Writes data to the YAML config file."""
+        """Writes data to the YAML config file.
+
+        Dumps to a temporary file next to the config and atomically renames
+        it into place, so a crash mid-write can never leave a truncated config.
+        """
         self._backup_config()
-        with open(self.beets_config_path, "w") as f:
-            yaml.dump(data, f, sort_keys=False)
+        tmp_path = self.beets_config_path.with_suffix(".yaml.tmp")
+        with open(tmp_path, "w") as f:
+            yaml.dump(data, f, Dumper=_Dumper, sort_keys=False)
+        os.replace(tmp_path, self.beets_config_path)
+        # We already know the new content, so re-prime the cache instead of
+        # invalidating it and paying for a re-parse on the next read. The
+        # dict is stored as-is: callers hand over ownership of `data`.
+        try:
+            st = self.beets_config_path.stat()
+            self._cache = ((st.st_mtime_ns, st.st_size), data)
+        except OSError:
+            self._cache = None
+
+
+@lru_cache(maxsize=1)
+def get_config_service() -> ConfigService:
+    """Shared ConfigService instance.
+
+    Constructing the service per call would start with a cold parse
+    cache every time. The shared instance keeps its stat-keyed cache
+    across callers, so the config YAML is only re-parsed when the file
+    on disk actually changes.
+    """
+    return ConfigService()
@@ -25,13 +25,17 @@ from beets.library.models import Item as LibraryItem
 from sqlalchemy import (
     ForeignKey,
     UniqueConstraint,
+    delete,
+    func,
     select,
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import (
     Mapped,
     Session,
     mapped_column,
     relationship,
+    selectinload,
 )
 
 from beets_flask.database.models.base import Base
@@ -129,7 +133,9 @@ class FolderInDb(Base):
         return Path(self.full_path)
 
     @classmethod
-    def get_current_on_disk(cls, hash: str, path: Path | str) -> Folder | Archive:
+    def get_current_on_disk(
+        cls, hash: str, path: Path | str, db_session: Session | None = None
+    ) -> Folder | Archive:
         """
         Check that a folders hash is still the same, as you have previously determined.
 
@@ -141,7 +147,7 @@ class FolderInDb(Base):
         """
         from beets_flask.database.setup import db_session_factory
 
-        with db_session_factory() as db_session:
+        with db_session_factory(db_session) as db_session:
             if isinstance(path, str):
                 path = Path(path)
             # Check if archive
@@ -295,10 +301,16 @@ class SessionStateInDb(Base):
         from beets_flask.database import db_session_factory
 
         with db_session_factory(db_session) as db_session:
+            # Eager-load tasks and their candidates along with the session,
+            # to_live_state touches all of them and would otherwise trigger
+            # one lazy SELECT per task/candidate collection.
+            eager = selectinload(cls.tasks).selectinload(TaskStateInDb.candidates)
+
             item = None
             if hash is not None:
                 query = (
                     select(cls)
+                    .options(eager)
                     .where(cls.folder_hash == hash)
                     # hash+revision combos have unique constraints
                     # and sessions always point to the latest / highest revision.
@@ -310,6 +322,7 @@ class SessionStateInDb(Base):
                 # paths do not have revisions, always use last updated session
                 query = (
                     select(cls)
+                    .options(eager)
                     .join(cls.folder)
                     .where(FolderInDb.full_path == str(path))
                     .order_by(cls.updated_at.desc(), cls.folder_revision.desc())
@@ -318,6 +331,171 @@ class SessionStateInDb(Base):
 
             return item
 
+    @classmethod
+    def exists_by_hash_and_path(
+        cls,
+        hash: str | None,
+        path: Path | str | None,
+        db_session: Session | None = None,
+    ) -> bool:
+        """Check if a session exists for this hash (or, failing that, path).
+
+        Same lookup criteria as get_by_hash_and_path, but a plain existence
+        probe: no row data is loaded and no tasks/candidates are fetched.
+        """
+        from beets_flask.database import db_session_factory
+
+        with db_session_factory(db_session) as db_session:
+            if hash is not None:
+                query = select(cls.id).where(cls.folder_hash == hash).limit(1)
+                if db_session.execute(query).scalar() is not None:
+                    return True
+            if path is not None:
+                query = (
+                    select(cls.id)
+                    .join(cls.folder)
+                    .where(FolderInDb.full_path == str(path))
+                    .limit(1)
+                )
+                if db_session.execute(query).scalar() is not None:
+                    return True
+            return False
+
+    def upsert(self, db_session: Session) -> None:
+        """Write this session state with all tasks and candidates to the db.
+
+        Replaces db_session.merge() on the worker write path: merge issues
+        one SELECT per session, task and candidate to decide between INSERT
+        and UPDATE. Here we emit one INSERT ... ON CONFLICT DO UPDATE per
+        table plus orphan cleanup - a handful of statements no matter how
+        many candidates a preview fetched.
+        """
+        tasks = list(self.tasks)
+        task_ids = [t.id for t in tasks]
+        candidate_ids = [c.id for t in tasks for c in t.candidates]
+
+        # folder first, it is the fk target of the session row
+        self._upsert_rows(
+            db_session,
+            FolderInDb.__table__,
+            [
+                {
+                    "id": self.folder.id,
+                    "full_path": self.folder.full_path,
+                    "is_album": self.folder.is_album,
+                }
+            ],
+            index_elements=("id", "full_path"),
+        )
+
+        # Unset folder_revision behaves like merge() did: the column default
+        # (0) applies on insert, an existing revision is left untouched.
+        revision_unset = self.folder_revision is None
+        self._upsert_rows(
+            db_session,
+            SessionStateInDb.__table__,
+            [
+                {
+                    "id": self.id,
+                    "folder_hash": self.folder.id,
+                    "folder_revision": 0 if revision_unset else self.folder_revision,
+                    "progress": self.progress,
+                    "exc": self.exc,
+                }
+            ],
+            preserve=("folder_revision",) if revision_unset else (),
+        )
+
+        # mirror the delete-orphan cascade of the relationships: drop tasks
+        # that left this session (and their candidates), then candidates
+        # that left the remaining tasks
+        stale_tasks = select(TaskStateInDb.id).where(
+            TaskStateInDb.session_id == self.id,
+            TaskStateInDb.id.not_in(task_ids),
+        )
+        db_session.execute(
+            delete(CandidateStateInDb).where(
+                CandidateStateInDb.task_id.in_(stale_tasks)
+            )
+        )
+        db_session.execute(
+            delete(TaskStateInDb).where(TaskStateInDb.id.in_(stale_tasks))
+        )
+
+        if tasks:
+            self._upsert_rows(
+                db_session,
+                TaskStateInDb.__table__,
+                [
+                    {
+                        "id": t.id,
+                        "session_id": self.id,
+                        "chosen_candidate_id": t.chosen_candidate_id,
+                        "toppath": t.toppath,
+                        "paths": t.paths,
+                        "old_paths": t.old_paths,
+                        "items": t.items,
+                        "choice_flag": t.choice_flag,
+                        "cur_artist": t.cur_artist,
+                        "cur_album": t.cur_album,
+                        "progress": t.progress,
+                    }
+                    for t in tasks
+                ],
+            )
+            db_session.execute(
+                delete(CandidateStateInDb).where(
+                    CandidateStateInDb.task_id.in_(task_ids),
+                    CandidateStateInDb.id.not_in(candidate_ids),
+                )
+            )
+        if candidate_ids:
+            self._upsert_rows(
+                db_session,
+                CandidateStateInDb.__table__,
+                [
+                    {
+                        "id": c.id,
+                        "task_id": t.id,
+                        "match": c.match,
+                        "duplicate_ids": c.duplicate_ids,
+                        "mapping": c.mapping,
+                    }
+                    for t in tasks
+                    for c in t.candidates
+                ],
+            )
+
+    @staticmethod
+    def _upsert_rows(
+        db_session: Session,
+        table,
+        rows: list[dict[str, Any]],
+        index_elements: tuple[str, ...] = ("id",),
+        preserve: tuple[str, ...] = (),
+    ) -> None:
+        """Insert-or-update the given rows in one statement.
+
+        Columns in `preserve` are written on insert but keep their existing
+        value when the row already exists.
+        """
+        stmt = sqlite_insert(table).values(rows)
+        # subscript access: attribute access would shadow e.g. `items`
+        # with the ColumnCollection method of the same name
+        skip = set(index_elements) | set(preserve) | {"created_at"}
+        set_ = {
+            c.name: stmt.excluded[c.name]
+            for c in table.columns
+            if c.name not in skip
+        }
+        # the onupdate default of updated_at does not fire for core upserts
+        set_["updated_at"] = func.now()
+        db_session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=list(index_elements), set_=set_
+            )
+        )
+
     @property
     def exception(self) -> SerializedException | None:
         """Returns the exception of the session if it failed."""
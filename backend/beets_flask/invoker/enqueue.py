@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from collections.abc import Awaitable, Callable
 from enum import Enum
+from functools import wraps
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -12,6 +14,7 @@ from typing import (
 )
 
 from beets.ui import _open_library
+from rq.job import Job
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
@@ -37,9 +40,10 @@ from beets_flask.importer.session import (
 )
 from beets_flask.importer.types import DuplicateAction
 from beets_flask.logger import log
-from beets_flask.redis import import_queue, preview_queue
+from beets_flask.redis import import_queue, preview_queue, redis_conn
 from beets_flask.server.exceptions import (
     InvalidUsageException,
+    SerializedException,
     exception_as_return_value,
 )
 from beets_flask.server.websocket.status import (
@@ -51,14 +55,66 @@ from beets_flask.server.websocket.status import (
 from .job import ExtraJobMeta, _set_job_meta
 
 if TYPE_CHECKING:
-    from rq.job import Job
     from rq.queue import Queue
 
 
+# Job status updates are deduplicated per process: callbacks record their
+# job id and drain the buffer before returning. rq's forking worker exits
+# the work horse right after the success callback, so the flush has to
+# complete synchronously - but when several updates did pile up (e.g.
+# synchronous queues in tests), one flush bulk-fetches all metas via
+# Job.fetch_many and emits the clean ones as a single JobStatusUpdate.
+_job_update_lock = threading.Lock()
+# job id -> serialized exception (if any), deduplicated by job id
+_pending_job_updates: dict[str, SerializedException | None] = {}
+
+
+async def _flush_job_updates():
+    """Emit all pending job updates, batching clean jobs into one message."""
+    with _job_update_lock:
+        pending = dict(_pending_job_updates)
+        _pending_job_updates.clear()
+
+    if not pending:
+        return
+
+    # one pipelined round trip for all metas
+    jobs = Job.fetch_many(list(pending.keys()), connection=redis_conn)
+    metas = {job.id: job.get_meta(refresh=False) for job in jobs if job is not None}
+
+    # failed jobs keep their own update, so no exception gets lost
+    ok_metas = [
+        metas[job_id] for job_id, exc in pending.items()
+        if exc is None and job_id in metas
+    ]
+    if ok_metas:
+        await send_status_update(
+            JobStatusUpdate(
+                message="Job status update",
+                num_jobs=len(ok_metas),
+                job_metas=ok_metas,
+            )
+        )
+    for job_id, exc in pending.items():
+        if exc is None:
+            continue
+        await send_status_update(
+            JobStatusUpdate(
+                message="Job status update",
+                num_jobs=1,
+                job_metas=[metas[job_id]] if job_id in metas else [],
+                exc=exc,
+            )
+        )
+
+
 def emit_update_on_job_change(job, connection, result, *args, **kwargs):
     """
     Callback for rq enqueue functions to emit a job status update via websocket.
 
+    The update is flushed before the callback returns (rq's forking worker
+    exits the work horse right after), see _flush_job_updates.
+
     See https://python-rq.org/docs/#success-callback
     """
     log.debug(f"job update for socket {job=} {connection=} {result=} {args=} {kwargs=}")
@@ -72,17 +128,12 @@ def emit_update_on_job_change(job, connection, result, *args, **kwargs):
             return True
         return False
 
-    try:
-        asyncio.run(
-            send_status_update(
-                JobStatusUpdate(
-                    message="Job status update",
-                    num_jobs=1,
-                    job_metas=[job.get_meta()],
-                    exc=result if _is_serialized_exception(result) else None,
-                )
-            )
+    with _job_update_lock:
+        _pending_job_updates[job.id] = (
+            result if _is_serialized_exception(result) else None
         )
+    try:
+        asyncio.run(_flush_job_updates())
     except Exception as e:
         log.error(f"Failed to emit job update: {e}", exc_info=True)
 
@@ -170,21 +221,11 @@ async def enqueue(
     if extra_meta is None:
         extra_meta = ExtraJobMeta()
 
-    match kind:
-        case EnqueueKind.PREVIEW:
-            job = enqueue_preview(hash, path, extra_meta, **kwargs)
-        case EnqueueKind.PREVIEW_ADD_CANDIDATES:
-            job = enqueue_preview_add_candidates(hash, path, extra_meta, **kwargs)
-        case EnqueueKind.IMPORT_AUTO:
-            job = enqueue_import_auto(hash, path, extra_meta, **kwargs)
-        case EnqueueKind.IMPORT_CANDIDATE:
-            job = enqueue_import_candidate(hash, path, extra_meta, **kwargs)
-        case EnqueueKind.IMPORT_BOOTLEG:
-            job = enqueue_import_bootleg(hash, path, extra_meta, **kwargs)
-        case EnqueueKind.IMPORT_UNDO:
-            job = enqueue_import_undo(hash, path, extra_meta, **kwargs)
-        case _:
-            raise InvalidUsageException(f"Unknown kind {kind}")
+    try:
+        handler = _ENQUEUE_BY_KIND[kind]
+    except KeyError:
+        raise InvalidUsageException(f"Unknown kind {kind}")
+    job = handler(hash, path, extra_meta, **kwargs)
 
     log.debug(f"Enqueued {job.id=} {job.meta=}")
 
@@ -195,17 +236,47 @@ async def enqueue(
 # Mainly input validation and submitting to the redis queue
 
 
+def _accepts_kwargs(kind: EnqueueKind, *allowed: str):
+    """Reject unexpected kwargs on an enqueue entry point.
+
+    Replaces the per-function `len(kwargs.keys()) > 0` checks: the allowed
+    set and error message are built once at decoration time, leaving a
+    single set difference per call.
+    """
+
+    def decorator(fn: Callable[..., R]) -> Callable[..., R]:
+        allowed_set = frozenset(allowed)
+        if allowed:
+            message = (
+                f"EnqueueKind.{kind.name} only accepts the following kwargs: "
+                + ", ".join(allowed)
+                + "."
+            )
+        else:
+            message = f"EnqueueKind.{kind.name} does not accept any kwargs."
+
+        @wraps(fn)
+        def wrapper(hash: str, path: str, extra_meta: ExtraJobMeta, **kwargs) -> R:
+            if kwargs.keys() - allowed_set:
+                raise InvalidUsageException(message)
+            return fn(hash, path, extra_meta, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@_accepts_kwargs(EnqueueKind.PREVIEW, "group_albums", "autotag")
 def enqueue_preview(hash: str, path: str, extra_meta: ExtraJobMeta, **kwargs) -> Job:
     group_albums: bool | None = kwargs.pop("group_albums", None)
     autotag: bool | None = kwargs.pop("autotag", None)
 
-    if len(kwargs.keys()) > 0:
-        raise InvalidUsageException("EnqueueKind.PREVIEW does not accept any kwargs.")
     job = _enqueue(preview_queue, run_preview, hash, path, group_albums, autotag)
     _set_job_meta(job, hash, path, EnqueueKind.PREVIEW, extra_meta)
     return job
 
 
+@_accepts_kwargs(EnqueueKind.PREVIEW_ADD_CANDIDATES, "search")
 def enqueue_preview_add_candidates(
     hash: str, path: str, extra_meta: ExtraJobMeta, **kwargs
 ) -> Job:
@@ -213,11 +284,6 @@ def enqueue_preview_add_candidates(
     # As always to allow task mapping
 
     search: TaskIdMappingArg[Search | Literal["skip"]] = kwargs.pop("search", None)
-    if len(kwargs.keys()) > 0:
-        raise InvalidUsageException(
-            "EnqueueKind.PREVIEW_ADD_CANDIDATES only accepts the following kwargs: "
-            + "search"
-        )
 
     if search is None:
         raise InvalidUsageException(
@@ -238,6 +304,7 @@ def enqueue_preview_add_candidates(
     return job
 
 
+@_accepts_kwargs(EnqueueKind.IMPORT_CANDIDATE, "candidate_ids", "duplicate_actions")
 def enqueue_import_candidate(
     hash: str, path: str, extra_meta: ExtraJobMeta, **kwargs
 ) -> Job:
@@ -262,30 +329,24 @@ def enqueue_import_candidate(
         "duplicate_actions", None
     )
 
-    if len(kwargs.keys()) > 0:
-        raise InvalidUsageException(
-            "EnqueueKind.IMPORT only accepts the following kwargs: "
-            + "candidate_ids, duplicate_actions."
-        )
-
     # TODO: Validation: lookup candidates exits
 
     # For convenience: if the user calls this but no preview was generated before,
     # use the auto-import instead (which also fetches previews).
-    try:
-        # TODO: along with validation:
-        # we need a special flag as task_id that stands for "do this for all tasks"
-        # used along with candidate_ids length == 1.
-        # then, only run the fallback auto-import for the args coming from gui import button
-
-        # If the user did not specify a candidate_id, we assume they want the best
-        # candidate.
-        with db_session_factory() as db_session:
-            _get_live_state_by_folder(hash, path, db_session)
-            # raises if no state found
-    except:
+    # TODO: along with validation:
+    # we need a special flag as task_id that stands for "do this for all tasks"
+    # used along with candidate_ids length == 1.
+    # then, only run the fallback auto-import for the args coming from gui import button
+
+    # A cheap existence probe is enough here - run_import_candidate loads the
+    # full state itself once the job runs.
+    with db_session_factory() as db_session:
+        state_exists = SessionStateInDb.exists_by_hash_and_path(
+            hash, path, db_session
+        )
+    if not state_exists:
         log.info(
-            f"No previous session state fround for {hash=} {path=} "
+            f"No previous session state found for {hash=} {path=} "
             + "switching to auto-import"
         )
         return enqueue_import_auto(hash, path, extra_meta)
@@ -302,6 +363,13 @@ def enqueue_import_candidate(
     return job
 
 
+@_accepts_kwargs(
+    EnqueueKind.IMPORT_AUTO,
+    "group_albums",
+    "autotag",
+    "import_threshold",
+    "duplicate_actions",
+)
 def enqueue_import_auto(hash: str, path: str, extra_meta: ExtraJobMeta, **kwargs):
     """
     Enqueue an automatic import.
@@ -322,18 +390,22 @@ def enqueue_import_auto(hash: str, path: str, extra_meta: ExtraJobMeta, **kwargs
         "duplicate_actions", None
     )
 
-    if len(kwargs.keys()) > 0:
-        raise InvalidUsageException(
-            "EnqueueKind.IMPORT_AUTO only accepts the following kwargs: "
-            + "group_albums, autotag, import_threshold, duplicate_actions."
-        )
-
     # We only assign the on_success callback (likely coming
     # via a kwarg) to the second job!
-    job1 = preview_queue.enqueue(
-        run_preview, hash, path, group_albums=group_albums, autotag=autotag, **kwargs
-    )
-    _set_job_meta(job1, hash, path, EnqueueKind._AUTO_PREVIEW, extra_meta)
+    # Batch the preview enqueue together with its meta save into a single
+    # redis round trip. job2 depends on job1, so job1 has to exist in redis
+    # before job2's dependency setup runs - hence job2 stays un-pipelined.
+    with preview_queue.connection.pipeline() as pipe:
+        job1 = preview_queue.enqueue_call(
+            run_preview,
+            args=(hash, path),
+            kwargs={"group_albums": group_albums, "autotag": autotag},
+            pipeline=pipe,
+        )
+        _set_job_meta(
+            job1, hash, path, EnqueueKind._AUTO_PREVIEW, extra_meta, pipeline=pipe
+        )
+        pipe.execute()
     job2 = _enqueue(
         import_queue,
         run_import_auto,
@@ -356,15 +428,10 @@ def enqueue_import_bootleg(hash: str, path: str, extra_meta: ExtraJobMeta, **kwa
     return job
 
 
+@_accepts_kwargs(EnqueueKind.IMPORT_UNDO, "delete_files")
 def enqueue_import_undo(hash: str, path: str, extra_meta: ExtraJobMeta, **kwargs):
     delete_files: bool = kwargs.pop("delete_files", True)
 
-    if len(kwargs.keys()) > 0:
-        raise InvalidUsageException(
-            "EnqueueKind.IMPORT_UNDO only accepts the following kwargs: "
-            + "delete_files."
-        )
-
     job = _enqueue(
         import_queue,
         run_import_undo,
@@ -382,17 +449,30 @@ def enqueue_delete_items(task_ids: list[str]) -> Job:
     A bit of a special case as this does not use the normal
     hash and path based enqueueing.
     """
-    job = _enqueue(
-        import_queue,
-        delete_items,
-        task_ids,
-        True,
-        # rq has no proper typing therefore our kwargs are not type checked properly
-        at_front=True,  # type: ignore
-    )
+    # Single round trip: job creation and queue push share one pipeline.
+    with import_queue.connection.pipeline() as pipe:
+        job = import_queue.enqueue_call(
+            delete_items,
+            args=(task_ids, True),
+            at_front=True,
+            on_success=emit_update_on_job_change,
+            pipeline=pipe,
+        )
+        pipe.execute()
     return job
 
 
+# Static dispatch for enqueue(), one lookup instead of a case chain.
+_ENQUEUE_BY_KIND: dict[EnqueueKind, Callable[..., Job]] = {
+    EnqueueKind.PREVIEW: enqueue_preview,
+    EnqueueKind.PREVIEW_ADD_CANDIDATES: enqueue_preview_add_candidates,
+    EnqueueKind.IMPORT_AUTO: enqueue_import_auto,
+    EnqueueKind.IMPORT_CANDIDATE: enqueue_import_candidate,
+    EnqueueKind.IMPORT_BOOTLEG: enqueue_import_bootleg,
+    EnqueueKind.IMPORT_UNDO: enqueue_import_undo,
+}
+
+
 # -------------------- Functions that run in redis workers ------------------- #
 # TODO: We might want to move these to their own file, for a bit better separation of
 # concerns.
@@ -434,7 +514,7 @@ async def run_preview(
     log.info(f"Preview task on {hash=} {path=}")
 
     with db_session_factory() as db_session:
-        f_on_disk = FolderInDb.get_current_on_disk(hash, path)
+        f_on_disk = FolderInDb.get_current_on_disk(hash, path, db_session)
         if hash != f_on_disk.hash:
             log.warning(
                 f"Folder content has changed since the job was scheduled for {path}. "
@@ -452,16 +532,19 @@ async def run_preview(
         try:
             await p_session.run_async()
         finally:
-            # Get max revision for this folder hash
-            stmt = select(func.max(SessionStateInDb.folder_revision)).where(
-                SessionStateInDb.folder_hash == hash,
-            )
-            max_rev = db_session.execute(stmt).scalar_one_or_none()
-            new_rev = 0 if max_rev is None else max_rev + 1
             s_state_indb = SessionStateInDb.from_live_state(p_session.state)
-            s_state_indb.folder_revision = new_rev
+            # Compute the next revision inside the INSERT itself instead of a
+            # separate SELECT MAX round trip. This is atomic, so two
+            # concurrent previews can no longer pick the same revision.
+            s_state_indb.folder_revision = (  # type: ignore[assignment]
+                select(
+                    func.coalesce(func.max(SessionStateInDb.folder_revision) + 1, 0)
+                )
+                .where(SessionStateInDb.folder_hash == hash)
+                .scalar_subquery()
+            )
 
-            db_session.merge(s_state_indb)
+            s_state_indb.upsert(db_session)
             db_session.commit()
 
     log.info(f"Preview done. {hash=} {path=}")
@@ -497,7 +580,7 @@ async def run_preview_add_candidates(
             await a_session.run_async()
         finally:
             s_state_indb = SessionStateInDb.from_live_state(a_session.state)
-            db_session.merge(instance=s_state_indb)
+            s_state_indb.upsert(db_session)
             db_session.commit()
 
     log.info(f"Add candidates done. {hash=} {path=}")
@@ -536,7 +619,7 @@ async def run_import_candidate(
             await i_session.run_async()
         finally:
             s_state_indb = SessionStateInDb.from_live_state(i_session.state)
-            db_session.merge(instance=s_state_indb)
+            s_state_indb.upsert(db_session)
             db_session.commit()
 
     log.info(f"Import candidate done. {hash=} {path=}")
@@ -565,7 +648,7 @@ async def run_import_auto(
             await i_session.run_async()
         finally:
             s_state_indb = SessionStateInDb.from_live_state(i_session.state)
-            db_session.merge(instance=s_state_indb)
+            s_state_indb.upsert(db_session)
             db_session.commit()
 
     log.info(f"Auto Import done. {hash=} {path=}")
@@ -589,7 +672,7 @@ async def run_import_bootleg(hash: str, path: str):
             await i_session.run_async()
         finally:
             s_state_indb = SessionStateInDb.from_live_state(i_session.state)
-            db_session.merge(instance=s_state_indb)
+            s_state_indb.upsert(db_session)
             db_session.commit()
 
     log.info(f"Bootleg Import done. {hash=} {path=}")
@@ -608,7 +691,7 @@ async def run_import_undo(hash: str, path: str, delete_files: bool):
             await i_session.run_async()
         finally:
             s_state_indb = SessionStateInDb.from_live_state(i_session.state)
-            db_session.merge(instance=s_state_indb)
+            s_state_indb.upsert(db_session)
             db_session.commit()
 
     log.info(f"Import Undo done. {hash=} {path=}")
@@ -617,7 +700,9 @@ async def run_import_undo(hash: str, path: str, delete_files: bool):
 def _get_live_state_by_folder(
     hash: str, path: str, db_session: Session, create_if_not_exists=False
 ) -> SessionState:
-    f_on_disk = FolderInDb.get_current_on_disk(hash, path)
+    # reuse the caller's session so the folder check does not open a second
+    # connection for its lookup
+    f_on_disk = FolderInDb.get_current_on_disk(hash, path, db_session)
     if hash != f_on_disk.hash:
         log.warning(
             f"Folder content has changed since the job was scheduled for {path}. "
@@ -656,5 +741,7 @@ def _get_live_state_by_folder(
 
 def delete_items(task_ids: list[str], delete_files: bool = True):
     lib = _open_library(get_config())
+    # dedupe while keeping order, a repeated id would raise on second delete
+    task_ids = list(dict.fromkeys(task_ids))
     for task_id in task_ids:
         delete_from_beets(task_id, delete_files=delete_files, lib=lib)
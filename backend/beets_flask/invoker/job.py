@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, NotRequired, TypedDict
 
 if TYPE_CHECKING:
+    from redis.client import Pipeline
     from rq.job import Job
 
     from .enqueue import EnqueueKind
@@ -24,11 +25,21 @@ class JobMeta(RequiredJobMeta, ExtraJobMeta):
 
 
 def _set_job_meta(
-    job: Job, hash: str, path: str, kind: EnqueueKind, extra: ExtraJobMeta
+    job: Job,
+    hash: str,
+    path: str,
+    kind: EnqueueKind,
+    extra: ExtraJobMeta,
+    pipeline: Pipeline | None = None,
 ):
     job.meta["folder_hash"] = hash
     job.meta["folder_path"] = path
     job.meta["job_id"] = job.id
     job.meta["job_kind"] = kind.value
     job.meta["job_frontend_ref"] = extra.get("job_frontend_ref", None)
-    job.save_meta()
+    if pipeline is not None:
+        # Same write as job.save_meta(), but buffered into the caller's
+        # pipeline so it lands in the same redis round trip as the enqueue.
+        pipeline.hset(job.key, "meta", job.serializer.dumps(job.meta))
+    else:
+        job.save_meta()
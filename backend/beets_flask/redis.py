@@ -3,12 +3,23 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 
 from redis import Redis
+from redis.exceptions import RedisError
 from rq import Queue
 from rq.job import Job
+from rq.utils import get_version
 
 # Setup redis connection
 redis_conn = Redis()
 
+# Pre-warm rq's server version lookup. rq caches the result on the
+# connection object, but the first enqueue would otherwise pay an extra
+# INFO round trip.
+try:
+    get_version(redis_conn)
+except RedisError:
+    # redis may not be reachable at import time, rq retries on first enqueue
+    pass
+
 # Init our different queues
 preview_queue = Queue("preview", connection=redis_conn, default_timeout=600)
 import_queue = Queue("import", connection=redis_conn, default_timeout=600)
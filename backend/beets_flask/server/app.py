@@ -6,6 +6,7 @@ from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+import orjson
 from quart import Quart
 
 from ..config.flask_config import ServerConfig, init_server_config
@@ -59,28 +60,55 @@ from enum import Enum
 from quart.json.provider import DefaultJSONProvider
 
 
-class CustomProvider(DefaultJSONProvider):
-    def dumps(self, obj: Any, **kwargs: Any) -> str:
-        return json.dumps(obj, cls=Encoder, **kwargs)
+def _json_default(o: Any) -> Any:
+    if isinstance(o, bytes):
+        # Mainly used for paths
+        # b'/path/to/file' -> '/path/to/file'
+        # Might yield strange results for other byte objects
+        return o.decode("utf-8")
+
+    if isinstance(o, datetime):
+        return o.isoformat()
+
+    # Dataclasses are not serializable by default
+    if is_dataclass(o) and not isinstance(o, type):
+        return asdict(o)
+
+    # Enum values are not serializable by default
+    if isinstance(o, Enum):
+        return o.value
+
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
 
 
 class Encoder(json.JSONEncoder):
+    """Stdlib counterpart of _json_default, for direct json.dumps use."""
+
     def default(self, o):
-        if isinstance(o, bytes):
-            # Mainly used for paths
-            # b'/path/to/file' -> '/path/to/file'
-            # Might yield strange results for other byte objects
-            return o.decode("utf-8")
+        return _json_default(o)
 
-        if isinstance(o, datetime):
-            return o.isoformat()
 
-        # Dataclasses are not serializable by default
-        if is_dataclass(o) and not isinstance(o, type):
-            return asdict(o)
+class CustomProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson instead of the stdlib encoder.
 
-        # Enum values are not serializable by default
-        if isinstance(o, Enum):
-            return o.value
+    orjson parses and serializes in C, which matters for the large
+    item-id arrays and session states going through the api. Non-str
+    dict keys are stringified like the stdlib encoder did.
+    """
 
-        return json.JSONEncoder.default(self, o)
+    _option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_json_default, option=self._option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # orjson already produces bytes, skip the str round trip of the
+        # default implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_json_default, option=self._option),
+            mimetype="application/json",
+        )
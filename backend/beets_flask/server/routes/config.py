@@ -5,6 +5,7 @@ fetch settings once from the backend on first page-load.
 """
 
 from beets import __version__ as beets_version
+from beets.metadata_plugins import find_metadata_source_plugins
 from quart import Blueprint, jsonify
 
 from beets_flask.config import get_config
@@ -24,7 +25,6 @@ async def get_basic():
     """Get the config settings needed for the gui."""
     config = get_config()
     plugins = config["plugins"].as_str_seq()
-    from beets.metadata_plugins import find_metadata_source_plugins
 
     data_sources: list[str] = [
         p.__class__.data_source for p in find_metadata_source_plugins()
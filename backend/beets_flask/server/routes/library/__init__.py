@@ -3,6 +3,9 @@
 Makes it possible to query and expose items to the frontend.
 """
 
+import os
+
+from beets import util as beets_util
 from beets.ui import _open_library
 from quart import Blueprint, g
 
@@ -34,17 +37,34 @@ if TYPE_CHECKING:
     g = LibraryCtx()
 
 
+# Cached library handle. Quart's `g` is scoped to a single request, so
+# caching has to live at module (process) level - otherwise every request
+# pays for config parsing, sqlite open and schema check.
+_lib = None
+_lib_key: tuple | None = None
+
+
 @library_bp.before_request
 async def attach_library():
     """Attach the library to the global object.
 
-    This allows to reuse an open library for each request in the same thread.
+    The open library is cached per process and only reopened when the
+    configured database path changes or the file itself was replaced
+    (its inode changed).
     """
+    global _lib, _lib_key
+
     config = get_config()
     # we will need to see if keeping the db open from each thread is what we want,
     # the importer may want to write.
-    if not hasattr(g, "lib") or g.lib is None:
-        g.lib = _open_library(config)
-    else:
-        if str(g.lib.path) != str(config.as_path()):
-            g.lib = _open_library(config)
+    db_path = beets_util.normpath(config["library"].as_filename())
+    try:
+        st = os.stat(db_path)
+        key = (db_path, st.st_dev, st.st_ino)
+    except OSError:
+        key = (db_path, None, None)
+
+    if _lib is None or _lib_key != key:
+        _lib = _open_library(config)
+        _lib_key = key
+    g.lib = _lib
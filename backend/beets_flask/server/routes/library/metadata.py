@@ -3,10 +3,11 @@
 TODO: Or modify metadata for a library item.
 """
 
+import asyncio
 import os
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from beets import util as beets_util
 from quart import Blueprint, g
 from tinytag import TinyTag
 
@@ -23,6 +24,17 @@ metadata_bp = Blueprint("metadata", __name__)
 __all__ = ["metadata_bp"]
 
 
+@lru_cache(maxsize=4096)
+def _tag_as_dict(path: bytes, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a file's tags with TinyTag, cached per file version.
+
+    mtime_ns and size are only part of the cache key: the entry expires
+    when the file on disk changes, so repeat requests for an unchanged
+    item skip the parse entirely.
+    """
+    return TinyTag.get(path).as_dict()
+
+
 @metadata_bp.route("/item/<int:item_id>/metadata", methods=["GET"])
 async def item_metadata(item_id: int):
     # Item from beets library
@@ -34,13 +46,20 @@ async def item_metadata(item_id: int):
             f"Item with beets_id:'{item_id}' not found in beets db."
         )
 
-    # File
-    item_path = beets_util.syspath(item.path)
-    if not os.path.exists(item_path):
+    # File. One stat doubles as the existence check and the cache key.
+    # item.path is bytes and os.stat / TinyTag take it as-is, no need for
+    # the syspath decode round trip (only relevant on windows).
+    item_path = item.path
+    try:
+        st = os.stat(item_path)
+    except OSError:
+        # like os.path.exists: anything unstattable (missing, permission
+        # denied, path component not a directory) counts as not there
         raise IntegrityException(
-            f"Item file '{item_path}' does not exist for item beets_id:'{item_id}'."
+            f"Item file '{os.fsdecode(item_path)}' does not exist "
+            f"for item beets_id:'{item_id}'."
         )
 
-    # Get metadata
-    tag = TinyTag.get(item_path)
-    return tag.as_dict()
+    # Get metadata. Parsing is blocking file I/O, keep it off the event
+    # loop (cache hits return from the thread immediately).
+    return await asyncio.to_thread(_tag_as_dict, item_path, st.st_mtime_ns, st.st_size)
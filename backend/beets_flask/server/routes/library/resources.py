@@ -24,7 +24,7 @@ from typing import (
 
 from beets import util as beets_util
 from beets.dbcore import Model, Query, Results
-from beets.dbcore.query import Sort
+from beets.dbcore.query import InQuery, Sort
 from beets.library import Album, Item, Library, parse_query_string
 from quart import Blueprint, Response, abort, g, json, jsonify, request
 
@@ -271,10 +271,16 @@ async def albums_by_artist(artist_name: str):
     expanded = expanded_response()
     minimal = minimal_response()
 
+    # Bulk-load all matched albums in a single query instead of one
+    # get_album round trip per row, keeping the original row order.
+    ids = [row[0] for row in rows]
+    albums = {a.id: a for a in g.lib.albums(InQuery("id", ids))} if ids else {}
+
     return jsonify(
         [
-            _rep(g.lib.get_album(row[0]), expand=expanded, minimal=minimal)
-            for row in rows
+            _rep(albums[id], expand=expanded, minimal=minimal)
+            for id in ids
+            if id in albums
         ]
     )
 
@@ -372,8 +378,17 @@ async def items_by_artist(artist_name: str):
     expanded = expanded_response()
     minimal = minimal_response()
 
+    # Bulk-load all matched items in a single query instead of one
+    # get_item round trip per row, keeping the original row order.
+    ids = [row[0] for row in rows]
+    items = {item.id: item for item in g.lib.items(InQuery("id", ids))} if ids else {}
+
     return jsonify(
-        [_rep(g.lib.get_item(row[0]), expand=expanded, minimal=minimal) for row in rows]
+        [
+            _rep(items[id], expand=expanded, minimal=minimal)
+            for id in ids
+            if id in items
+        ]
     )
 
 
@@ -385,8 +400,10 @@ def delete_entities(entities: Sequence[Item | Album], delete_files=False) -> Non
     if get_config()["gui"]["library"]["readonly"].get(bool):
         raise ValueError("Library is read-only")
 
-    # Remove
-    [entity.remove(delete=delete_files) for entity in entities]
+    # Remove, sharing one transaction instead of a commit per entity
+    with g.lib.transaction():
+        for entity in entities:
+            entity.remove(delete=delete_files)
 
 
 def update_entities(entities: Sequence[T], data: dict) -> Sequence[T]:
@@ -394,10 +411,11 @@ def update_entities(entities: Sequence[T], data: dict) -> Sequence[T]:
     if get_config()["gui"]["library"]["readonly"].get(bool):
         raise ValueError("Library is read-only")
 
-    # Update
-    for entity in entities:
-        entity.update(data)
-        entity.try_sync(True, False)
+    # Update, sharing one transaction instead of a commit per entity
+    with g.lib.transaction():
+        for entity in entities:
+            entity.update(data)
+            entity.try_sync(True, False)
 
     return entities
 
@@ -31,7 +31,8 @@ def config_service(mock_config_data):
     """
     Create a ConfigService instance that works entirely in memory.
 
-    - _read_config_yaml returns a fresh copy of mock_config_data.
+    - _load_config_doc serves mock_config_data (reads go through the real
+      _read_config_yaml / _read_config_sections copy logic).
     - _write_config_yaml stores the last written config in `written["data"]`.
     - _backup_config is stubbed out (no filesystem access).
     """
@@ -40,13 +41,10 @@ def config_service(mock_config_data):
 
     written = {}
 
-    def fake_read():
-        return deepcopy(mock_config_data)
-
     def fake_write(data):
         written["data"] = deepcopy(data)
 
-    service._read_config_yaml = fake_read
+    service._load_config_doc = lambda: mock_config_data
     service._write_config_yaml = fake_write
     service._backup_config = lambda: None  # no real filesystem work
 
@@ -99,6 +97,71 @@ def test_update_metadata_plugin_config_disable(config_service):
     assert "discogs" not in data["plugins"]
 
 
+def test_update_metadata_plugins_config_batch(config_service):
+    service, written = config_service
+
+    # Two plugin updates, but only one write should happen
+    service.update_metadata_plugins_config(
+        {
+            "spotify": {"settings": {"api_key": "new_key"}, "enabled": True},
+            "discogs": {"settings": {}, "enabled": False},
+        }
+    )
+
+    data = written["data"]
+    assert "spotify" in data["plugins"]
+    assert data["spotify"]["api_key"] == "new_key"
+    assert "discogs" not in data["plugins"]
+
+
+def test_update_metadata_plugins_config_unsupported(config_service):
+    service, _ = config_service
+
+    with pytest.raises(ValueError):
+        service.update_metadata_plugins_config(
+            {"notaplugin": {"settings": {}, "enabled": True}}
+        )
+
+
+def test_update_metadata_plugin_config_noop_skips_write(config_service):
+    service, written = config_service
+
+    # Discogs is already enabled and only redacted/unchanged values are sent
+    service.update_metadata_plugin_config(
+        "discogs",
+        {"token": "********", "user_agent": "test_agent"},
+        enabled=True,
+    )
+
+    assert "data" not in written
+
+
+def test_read_config_yaml_cached(tmp_path):
+    """_read_config_yaml only re-parses when the file on disk actually changes."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("plugins: [discogs]\n")
+
+    service = ConfigService.__new__(ConfigService)
+    service.beets_config_path = config_path
+    service._cache = None
+
+    first = service._read_config_yaml()
+    assert first == {"plugins": ["discogs"]}
+
+    # Mutating the returned dict must not leak into the cache
+    first["plugins"].append("spotify")
+    assert service._read_config_yaml() == {"plugins": ["discogs"]}
+
+    # Unchanged file: served from cache, no parse
+    with patch("beets_flask.config_service.yaml.load") as m_load:
+        service._read_config_yaml()
+        m_load.assert_not_called()
+
+    # A change on disk invalidates the cache
+    config_path.write_text("plugins: [discogs, musicbrainz]\n")
+    assert service._read_config_yaml() == {"plugins": ["discogs", "musicbrainz"]}
+
+
 def test_backup_created_on_update(mock_config_data):
     """
     For backup behavior we call the real _write_config_yaml but stub out
@@ -108,13 +171,46 @@ def test_backup_created_on_update(mock_config_data):
     service.beets_config_path = Path("/fake/config.yaml")
 
     # Use in-memory config for reads
-    service._read_config_yaml = lambda: deepcopy(mock_config_data)
+    service._load_config_doc = lambda: mock_config_data
+
+    with patch("beets_flask.config_service.os.link") as m_link, \
+         patch("beets_flask.config_service.shutil.copy") as m_copy, \
+         patch("beets_flask.config_service.os.replace"), \
+         patch("pathlib.Path.unlink"), \
+         patch("builtins.open", mock_open()):
+        service.update_metadata_plugin_config(
+            "spotify", {"api_key": "new_key"}, enabled=True
+        )
+
+        backup_path = service.beets_config_path.with_suffix(".yaml.bak")
+        m_link.assert_called_once_with(service.beets_config_path, backup_path)
+        # hard link worked, no need for the copy fallback
+        m_copy.assert_not_called()
+
 
-    with patch("beets_flask.config_service.shutil.copy") as m_copy, \
+def test_backup_falls_back_to_copy(mock_config_data):
+    """If hard-linking fails (e.g. unsupported filesystem), we copy instead."""
+    service = ConfigService.__new__(ConfigService)
+    service.beets_config_path = Path("/fake/config.yaml")
+    service._load_config_doc = lambda: mock_config_data
+
+    with patch("beets_flask.config_service.os.link", side_effect=OSError) as m_link, \
+         patch("beets_flask.config_service.shutil.copy") as m_copy, \
+         patch("beets_flask.config_service.os.replace"), \
+         patch("pathlib.Path.unlink"), \
          patch("builtins.open", mock_open()):
         service.update_metadata_plugin_config(
             "spotify", {"api_key": "new_key"}, enabled=True
         )
 
         backup_path = service.beets_config_path.with_suffix(".yaml.bak")
-        m_copy.assert_called_once_with(service.beets_config_path, backup_path)
\ No newline at end of file
+        m_link.assert_called_once()
+        m_copy.assert_called_once_with(service.beets_config_path, backup_path)
+
+
+def test_get_config_service_shared():
+    """get_config_service hands out one shared instance."""
+    from beets_flask.config_service import get_config_service
+
+    get_config_service.cache_clear()
+    assert get_config_service() is get_config_service()
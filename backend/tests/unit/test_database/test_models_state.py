@@ -4,7 +4,11 @@ from pathlib import Path
 import pytest
 from beets import autotag, importer
 
-from beets_flask.database.models.states import SessionStateInDb
+from beets_flask.database.models.states import (
+    CandidateStateInDb,
+    SessionStateInDb,
+    TaskStateInDb,
+)
 from beets_flask.importer.session import SessionState
 from beets_flask.importer.stages import Progress
 from tests.conftest import beets_lib_item
@@ -74,3 +78,70 @@ class TestSessionStateInDb:
             # Check that the progress is updated
             assert state_in_db.tasks[0].progress == Progress.IMPORT_COMPLETED
             assert len(state_in_db.tasks[0].candidates) == 0
+
+    def test_upsert_session(self, db_session_factory):
+        # Insert: a fresh state round-trips through upsert
+        state_in_db = SessionStateInDb.from_live_state(self.state)
+        # ids are stable across from_live_state calls, keep them for row checks
+        task_id = state_in_db.tasks[0].id
+        with db_session_factory() as s:
+            state_in_db.upsert(s)
+            s.commit()
+
+        with db_session_factory() as s:
+            fetched = s.query(SessionStateInDb).filter_by(id=state_in_db.id).one()
+            assert fetched.folder.full_path == str(self.state.path)
+            assert len(fetched.tasks) == 1
+            assert len(fetched.tasks[0].candidates) == 1
+            # Unset revision falls back to the column default on insert
+            assert fetched.folder_revision == 0
+
+        # Update: progress changes stick, removed candidates are cleaned up
+        state_in_db = SessionStateInDb.from_live_state(self.state)
+        state_in_db.tasks[0].progress = Progress.IMPORT_COMPLETED
+        state_in_db.tasks[0].candidates = []
+        with db_session_factory() as s:
+            state_in_db.upsert(s)
+            s.commit()
+
+        with db_session_factory() as s:
+            fetched = s.query(SessionStateInDb).filter_by(id=state_in_db.id).one()
+            assert fetched.tasks[0].progress == Progress.IMPORT_COMPLETED
+            assert len(fetched.tasks[0].candidates) == 0
+            # The orphaned candidate row is gone, not just unlinked
+            assert s.query(CandidateStateInDb).filter_by(task_id=task_id).count() == 0
+
+        # An explicitly set revision is written ...
+        state_in_db = SessionStateInDb.from_live_state(self.state)
+        state_in_db.folder_revision = 3
+        with db_session_factory() as s:
+            state_in_db.upsert(s)
+            s.commit()
+
+        # ... and preserved by a later upsert that leaves it unset
+        state_in_db = SessionStateInDb.from_live_state(self.state)
+        with db_session_factory() as s:
+            state_in_db.upsert(s)
+            s.commit()
+
+        with db_session_factory() as s:
+            fetched = s.query(SessionStateInDb).filter_by(id=state_in_db.id).one()
+            assert fetched.folder_revision == 3
+
+        # Dropping all tasks removes them together with their candidates
+        state_in_db = SessionStateInDb.from_live_state(self.state)
+        state_in_db.tasks = []
+        with db_session_factory() as s:
+            state_in_db.upsert(s)
+            s.commit()
+
+        with db_session_factory() as s:
+            assert (
+                s.query(TaskStateInDb).filter_by(session_id=state_in_db.id).count()
+                == 0
+            )
+            assert s.query(CandidateStateInDb).filter_by(task_id=task_id).count() == 0
+            # The session row itself stays around
+            assert (
+                s.query(SessionStateInDb).filter_by(id=state_in_db.id).count() == 1
+            )